@@ -5,6 +5,8 @@ from dashboard.util import add_custom_css
 
 
 class WelcomePage:
+    __slots__ = ("user",)
+
     def __init__(self):
         self.user = None
 